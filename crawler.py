@@ -5,274 +5,426 @@
 # !/usr/bin/env python3
 import re
 import os
-from xml.dom import minidom
-from collections import defaultdict
+import time
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
-import json
-import requests
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urlsplit
+import httpx
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    import xml.etree.ElementTree as etree
+    lxml_html = None
 
 from bs4 import BeautifulSoup
 from tqdm.auto import tqdm
 from scidownl import scihub_download
+from diskcache import Cache
+import orjson
+
+# dblp is requested via https on its final host, so no redirect is needed and HTTP/2 is used
+DBLP_URL = "https://dblp.org"
+REQUEST_TIMEOUT = 30
+# retries of requests which failed with one of the given status codes
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# number of papers which are fetched concurrently
+MAX_WORKERS = 16
+# number of PDFs which are downloaded concurrently in the background
+MAX_DOWNLOADS = 8
+# prefixes and patterns to classify the links of publisher sites
+DOI_PREFIX = "https://doi.org"
+ARXIV_PREFIXES = ("https://arxiv.org", "http://arxiv.org")
+PDF_LINK_RE = re.compile(r"\.pdf$", re.IGNORECASE)
+# directory of the persistent cache for the dblp xml responses
+CACHE_DIR = "./.dblp_cache"
+# seconds until a cached dblp response is revalidated with dblp
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# HTTP/2 multiplexes the concurrent dblp requests over a single connection
+_SESSION = httpx.Client(
+    headers={"User-Agent": "dblp_crawler"},
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True, retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)),
+)
+
+_CACHE = Cache(CACHE_DIR)
+
+# information of the already extracted records, shared by all authors of a run
+_RECORD_INFOS = dict()
+_RECORD_LOCK = threading.Lock()
+
+# PDF downloads run in the background while the crawling continues,
+# the pool is kept alive for the whole process so main can be called repeatedly
+_DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_DOWNLOADS)
+_DOWNLOAD_FUTURES = dict()
+_QUEUED_DOWNLOADS = set()
+_DOWNLOAD_LOCK = threading.Lock()
+
+
+def get_session() -> httpx.Client:
+    """returns the shared session which is used for every request of the crawler
+       :return: pooled HTTP/2 client
+    """
+    return _SESSION
+
+
+def set_session(session: httpx.Client) -> None:
+    """replaces the shared session, e.g. to use custom headers or proxies
+       :param session: httpx client to use for all further requests
+    """
+    global _SESSION
+    _SESSION = session
+
+
+def fetch(url: str, headers: dict = None) -> httpx.Response:
+    """helper function to send a GET request with the shared session. Requests which are
+       rate limited or fail with a server error are retried with an exponential backoff
+       :param url: url to request
+       :param headers: additional headers of the request
+       :return: response of the request
+    """
+    for retry in range(MAX_RETRIES + 1):
+        response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code not in RETRY_STATUS_CODES or retry == MAX_RETRIES:
+            return response
+        time.sleep(RETRY_BACKOFF * 2 ** retry)
+
+
+def get_xml(url: str) -> bytes:
+    """helper function to fetch a dblp xml document. Responses are cached on disk and only
+       revalidated with their ETag/Last-Modified headers once they are older than CACHE_MAX_AGE
+       :param url: url of the xml document
+       :return: raw content of the xml document
+    """
+    cached = _CACHE.get(url)
+    if cached is not None and time.time() - cached.get("fetched", 0) < CACHE_MAX_AGE:
+        return cached["content"]
+
+    headers = dict()
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = fetch(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        cached["fetched"] = time.time()
+        _CACHE.set(url, cached)
+        return cached["content"]
+
+    if response.status_code == 200:
+        _CACHE.set(url, {"etag": response.headers.get("ETag"),
+                         "last_modified": response.headers.get("Last-Modified"),
+                         "fetched": time.time(), "content": response.content})
+
+    return response.content
+
+
+def get_links(response: httpx.Response) -> list:
+    """helper function to obtain the targets of all links on a html page
+       :param response: response of the html page
+       :return: list of the href attributes of all anchors
+    """
+    if lxml_html is not None:
+        return lxml_html.fromstring(response.content).xpath("//a/@href")
 
+    # pass the raw bytes, so the encoding is taken from the page instead of being guessed
+    soup = BeautifulSoup(response.content, features="html.parser")
+    return [link["href"] for link in soup.find_all("a", href=True)]
 
+
+@lru_cache(maxsize=None)
 def get_urlpt(name):
     """helper function to obtain the essential part of the name to URL mapping (urlpt)
        :params author_name: string of the authors name
        :returns: urlpt mapping
     """
-    url = "http://dblp.uni-trier.de/search/author?xauthor=" + name
-    response = requests.get(url)
-
-    xmldoc = minidom.parseString(response.content)
-    assert xmldoc.getElementsByTagName("author"), f"No author with the name '{name}' found.."
+    url = DBLP_URL + "/search/author?xauthor=" + name
+    content = get_xml(url)
+    xmldoc = etree.fromstring(content)
+    item = xmldoc.find(".//author")
+    assert item is not None, f"No author with the name '{name}' found.."
 
-    item = xmldoc.getElementsByTagName("author")[0]
+    return item.get("urlpt")
 
-    if item.hasAttribute("urlpt"):
-        return item.attributes["urlpt"].value
 
-    return None
-
-
-def get_list_of_papers(author_name: str) -> list:
+@lru_cache(maxsize=None)
+def get_list_of_papers(author_name: str) -> tuple:
     """fetches the response and parses it as xml
        :param author_name: string of the authors name
-       :return: list of the publications for the given author name
+       :return: tuple of the publication records for the given author name
     """
     # obtain the urlpt mapping. If not found, return none
     name = get_urlpt(author_name)
     if name is None:
         return None
 
-    # uses the urlpt mapping to get the authors publication url
-    url = "http://dblp.uni-trier.de/pers/xk/" + name + ".xml"
-    response = requests.get(url)
-
-    # parse the publication xml data and search for the dblpkey
-    # the dblpkey are the keys of the bibliographic records
-    xmldoc = minidom.parseString(response.content)
-    itemlist = xmldoc.getElementsByTagName("dblpkey")
+    # uses the urlpt mapping to get the authors publication url, which already
+    # contains the complete bibliographic records of all publications
+    url = DBLP_URL + "/pers/xx/" + name + ".xml"
+    content = get_xml(url)
 
+    # stream through the publication xml data and collect the records,
+    # every record is wrapped in a <r> element
     papers = list()
 
-    for item in itemlist:
-        if item.hasAttribute("type"):
-            if item.attributes["type"].value == "person record":
-                continue
-        rc = []
-        for node in item.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                rc.append(node.data)
-        papers.append("".join(rc))
+    for _, item in etree.iterparse(BytesIO(content), events=("end",)):
+        if item.tag != "r" or len(item) == 0:
+            continue
+        # detach the record so it is kept when the processed elements are dropped
+        record = item[0]
+        item.remove(record)
+        papers.append(record)
+        # drop the already processed elements to keep the tree small
+        item.clear()
+        if hasattr(item, "getprevious"):
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+
+    return tuple(papers)
+
+
+@lru_cache(maxsize=None)
+def _find_pdf_links(ee_url: str) -> tuple:
+    """helper function to search the publisher site of a paper for links to its pdf
+       :param ee_url: string of the electronic edition url of the paper
+       :return: tuple of the found pdf links (None if the site could not be parsed)
+                and of the doi links on the site
+    """
+    # the pdf of arxiv papers can be derived from the abstract url without crawling the site
+    if ee_url.startswith(ARXIV_PREFIXES):
+        return (ee_url.replace("/abs/", "/pdf/", 1) + ".pdf",), ()
+
+    pdf_links = list()
+    doi_links = list()
+    try:
+        html = fetch(ee_url)
+        # obtain the domain name once for all links of the page
+        split_url = urlsplit(str(html.url))
+        domain_string = f"{split_url.scheme}://{split_url.netloc}"
+        for href in get_links(html):
+            # if the site offers a doi link, use it (e.g. IEEE)
+            if href.startswith(DOI_PREFIX):
+                doi_links.append(href)
+
+            if PDF_LINK_RE.search(href):
+                # escape parsing failures für slash characters
+                href = href.replace("%2F", "/", 1)
+                # if the link does not start with the domain name, concat it
+                # unless it starts with another domain, then use that instead
+                if not href.startswith(domain_string) and not href.startswith("http"):
+                    href = domain_string + href
+                pdf_links.append(href)
+
+    except Exception as _:
+        return None, ()
+
+    return tuple(pdf_links), tuple(doi_links)
+
+
+def _extract_records(xmldoc, tags: tuple) -> dict:
+    """helper function to gather the information of all records with one of the given tags
+       :param xmldoc: parsed xml document or record element of the paper
+       :param tags: tag names of the records, e.g. article or inproceedings
+       :return: dict of the information gathered for the records
+    """
+    paper_info = {"author": [], "editor": [], "title": "", "year": "0", "links": "",
+                  "pdf_links": []}
+
+    # the record is either the element itself or a child of the xml document
+    items = [xmldoc] if xmldoc.tag in tags else [item for item in xmldoc if item.tag in tags]
+
+    for item in items:
+        # gather all fields in a single pass over the children of the record,
+        # only the first title, year and ee of a record are used
+        for child in item:
+            if child.tag == "author":
+                paper_info["author"].append(child.text)
+            elif child.tag == "editor":
+                paper_info["editor"].append(child.text)
+            elif child.tag == "title" and not paper_info["title"]:
+                # titles may contain markup like <i> or <sub>, so join all of their text
+                paper_info["title"] = "".join(child.itertext())
+            elif child.tag == "year" and paper_info["year"] == "0":
+                paper_info["year"] = child.text
+            elif child.tag == "ee" and not paper_info["links"]:
+                paper_info["links"] = child.text
+
+    return paper_info
+
+
+def _make_extractor(*tags):
+    """helper function to create the extractor for a publication type
+       :param tags: tag names of the records of the publication type
+       :return: function to gather the information of a record of the publication type
+    """
+    def extractor(xmldoc) -> dict:
+        return _extract_records(xmldoc, tags)
+
+    return extractor
 
-    return papers
 
+# extractors of the supported publication types, keyed by the first part of the dblp key
+_EXTRACTORS = {
+    "journals": _make_extractor("article", "proceedings"),
+    "conf": _make_extractor("inproceedings", "proceedings"),
+    "books": _make_extractor("book", "incollection", "proceedings"),
+    "series": _make_extractor("book", "incollection", "proceedings"),
+    "reference": _make_extractor("book", "incollection"),
+    "phd": _make_extractor("phdthesis"),
+    "ms": _make_extractor("mastersthesis"),
+    "tr": _make_extractor("article", "book"),
+}
 
-def get_paper_info(paper: str, download_pdf: bool, author_name: str) -> defaultdict:
+
+def get_paper_info(paper, download_pdf: bool, save_dir: Path,
+                   collect_pdf_links: bool = False) -> dict:
     """helper function to obtain the information of a specific paper
-       :param paper: string of the paper suburl
+       :param paper: xml element of the papers bibliographic record
        :param download_pdfs: flag to save the corresponding PDFs in a folder
-       :param author_name: string of the authors name
-       :return: defaultdict of the information gathered for the chosen paper
+       :param save_dir: directory to save the PDFs of the author in
+       :param collect_pdf_links: flag to search the publisher site for pdf links
+       :return: dict of the information gathered for the chosen paper
     """
-    url = "http://dblp.uni-trier.de/rec/xml/" + paper + ".xml"
-    response = requests.get(url)
-    xmldoc = minidom.parseString(response.content)
-    publication_type = paper.split("/")[0]
-
-    paper_info = defaultdict(lambda: [])
-
-    if publication_type == "journals":
-        article_items = xmldoc.getElementsByTagName("article")
-        if len(article_items) > 0:
-            for item in article_items:
-                for author in item.getElementsByTagName("author"):
-                    paper_info["author"].append(author.firstChild.data)
-
-                if item.getElementsByTagName("title"):
-                    paper_info["title"] = item.getElementsByTagName("title")[0].firstChild.data
-
-                paper_info["year"] = "0"
-                if item.getElementsByTagName("year"):
-                    paper_info["year"] = item.getElementsByTagName("year")[0].firstChild.data
-
-                paper_info["links"] = ""
-                if item.getElementsByTagName("ee"):
-                    paper_info["links"] = item.getElementsByTagName("ee")[
-                        0].firstChild.data
-                    # if download flag is true and a doi link is given, download the pdf
-                    if paper_info["links"].startswith("https://doi.org") and download_pdf:
-                        save_doi_pdfs(paper_info["links"], author_name, paper_info["title"])
-
-                    pdf_links = list()
-                    try:
-                        html = requests.get(paper_info["links"])
-                        soup = BeautifulSoup(html.text, features="html.parser")
-                        for link in soup.find_all("a"):
-                            # if the site offers a doi link, use it (e.g. IEEE)
-                            if link["href"].startswith("https://doi.org") and download_pdf:
-                                save_doi_pdfs(link["href"], author_name, paper_info["title"])
-
-                            # special treatment for arxiv links
-                            if paper_info["links"].startswith("https://arxiv.org") or \
-                                    paper_info["links"].startswith("http://arxiv.org"):
-                                link["href"] = paper_info["links"].replace("abs", "pdf", 1) + ".pdf"
-                                pdf_links.append(link["href"])
-                                break
-
-                            if link["href"].lower().endswith(".pdf"):
-                                # escape parsing failures für slash characters
-                                link["href"] = link["href"].replace(
-                                    "%2F", "/", 1)
-                                # obtain the domain name
-                                domain_string = re.search(
-                                    r"^(?:[^\/]*\/){2}([^\/]*)", html.url)
-                                # if the link does not start with the domain name, concat it
-                                if not link["href"].startswith(domain_string.group()):
-                                    # and if it starts with another domain, use that instead
-                                    if link["href"].startswith("http") or \
-                                            link["href"].startswith("https"):
-                                        pdf_links.append(link["href"])
-                                        if download_pdf:
-                                            save_other_pdfs(link["href"],
-                                                            author_name, paper_info["title"])
-                                    else:
-                                        pdf_links.append(
-                                            domain_string.group() + link["href"])
-                                        if download_pdf:
-                                            save_other_pdfs(link["href"],
-                                                            author_name, paper_info["title"])
-                                else:
-                                    pdf_links.append(link["href"])
-                                    if download_pdf:
-                                        save_other_pdfs(link["href"],
-                                                        author_name, paper_info["title"])
-                        paper_info["pdf_links"] = pdf_links
-
-                    except Exception as _:
-                        paper_info["pdf_links"] = ""
-        return paper_info
-
-    elif publication_type == "conf":
-        article_items = xmldoc.getElementsByTagName("inproceedings")
-        if len(article_items) > 0:
-            for item in article_items:
-                for author in item.getElementsByTagName("author"):
-                    paper_info["author"].append(author.firstChild.data)
-
-                if item.getElementsByTagName("title"):
-                    paper_info["title"] = item.getElementsByTagName("title")[0].firstChild.data
-
-                paper_info["year"] = "0"
-                if item.getElementsByTagName("year"):
-                    paper_info["year"] = item.getElementsByTagName("year")[0].firstChild.data
-
-                paper_info["links"] = ""
-                if item.getElementsByTagName("ee"):
-                    paper_info["links"] = item.getElementsByTagName("ee")[0].firstChild.data
-                    # if download flag is true and a doi link is given, download the pdf
-                    if paper_info["links"].startswith("https://doi.org") and download_pdf:
-                        save_doi_pdfs(paper_info["links"], author_name, paper_info["title"])
-
-                    pdf_links = list()
-                    try:
-                        html = requests.get(paper_info["links"])
-                        soup = BeautifulSoup(html.text, features="html.parser")
-                        for link in soup.find_all("a"):
-                            # if the site offers a doi link, use it (e.g. IEEE)
-                            if link["href"].startswith("https://doi.org") and download_pdf:
-                                save_doi_pdfs(link["href"], author_name, paper_info["title"])
-
-                            # special treatment for arxiv links
-                            if paper_info["links"].startswith("https://arxiv.org") or \
-                                paper_info["links"].startswith("http://arxiv.org"):
-                                link["href"] = paper_info["links"].replace("abs", "pdf", 1) + ".pdf"
-                                pdf_links.append(link["href"])
-                                break
-
-                            if link["href"].lower().endswith(".pdf"):
-                                # escape parsing failures für slash characters
-                                link["href"] = link["href"].replace("%2F", "/", 1)
-                                # obtain the domain name
-                                domain_string = re.search(r"^(?:[^\/]*\/){2}([^\/]*)", html.url)
-                                # if the link does not start with the domain name, concat it
-                                if not link["href"].startswith(domain_string.group()):
-                                    # and if it starts with another domain, use that instead
-                                    if link["href"].startswith("http") or \
-                                        link["href"].startswith("https"):
-                                        pdf_links.append(link["href"])
-                                        if download_pdf:
-                                            save_other_pdfs(link["href"],
-                                                            author_name, paper_info["title"])
-                                    else:
-                                        pdf_links.append(domain_string.group() + link["href"])
-                                        if download_pdf:
-                                            save_other_pdfs(link["href"],
-                                                            author_name, paper_info["title"])
-                                else:
-                                    pdf_links.append(link["href"])
-                                    if download_pdf:
-                                        save_other_pdfs(link["href"], author_name,
-                                                        paper_info["title"])
-                        paper_info["pdf_links"] = pdf_links
-
-                    except Exception as _:
-                        paper_info["pdf_links"] = ""
-        return paper_info
-    else:
+    key = paper.get("key")
+    extractor = _EXTRACTORS.get(key.split("/")[0])
+    if extractor is None:
         return None
 
+    # papers shared by several crawled authors are only extracted once
+    with _RECORD_LOCK:
+        record_info = _RECORD_INFOS.get(key)
+
+    if record_info is None:
+        # only fetch the record on its own if the bulk record lacks information
+        if paper.find("title") is None:
+            url = DBLP_URL + "/rec/xml/" + key + ".xml"
+            content = get_xml(url)
+            paper = etree.fromstring(content)
+
+        record_info = extractor(paper)
+        with _RECORD_LOCK:
+            _RECORD_INFOS[key] = record_info
+
+    # the pdf links and downloads depend on the author, so work on a copy of the record
+    paper_info = dict(record_info)
+
+    if paper_info["links"]:
+        # if download flag is true and a doi link is given, download the pdf
+        if download_pdf and paper_info["links"].startswith(DOI_PREFIX):
+            save_doi_pdfs(paper_info["links"], save_dir, paper_info["title"])
+
+        # the publisher site is only crawled if its pdf links are actually needed
+        if download_pdf or collect_pdf_links:
+            pdf_links, doi_links = _find_pdf_links(paper_info["links"])
+            if download_pdf:
+                for doi_link in doi_links:
+                    save_doi_pdfs(doi_link, save_dir, paper_info["title"])
+            paper_info["pdf_links"] = "" if pdf_links is None else list(pdf_links)
+        else:
+            paper_info["pdf_links"] = [paper_info["links"]]
 
-def save_doi_pdfs(url: str, name: str, paper_name: str) -> None:
-    """helper function to download the pdfs of a given doi link"""
-    name = name.replace(" ", "_").lower()
-    save_path = f"./{name}"
-    paper_name = paper_name.split("/")[-1] + ".pdf"
-    pdf_save_path = save_path + "/" + paper_name
-
+    return paper_info
 
-    if not os.path.isdir(save_path):
-        os.mkdir(save_path)
 
-    scihub_download(url, paper_type="doi", out=pdf_save_path)
+def save_doi_pdfs(url: str, save_dir: Path, paper_name: str) -> None:
+    """helper function to download the pdfs of a given doi link"""
+    pdf_save_path = save_dir / (paper_name.split("/")[-1] + ".pdf")
+
+    # the save path only depends on the paper, so different dois of the same paper
+    # (e.g. a journal and a conference version) would write into the same file at once.
+    # Only the first download of every file is queued
+    with _DOWNLOAD_LOCK:
+        if pdf_save_path in _QUEUED_DOWNLOADS:
+            return
+        _QUEUED_DOWNLOADS.add(pdf_save_path)
+        future = _DOWNLOAD_EXECUTOR.submit(scihub_download, url, paper_type="doi",
+                                           out=str(pdf_save_path))
+        _DOWNLOAD_FUTURES[future] = url
+
+
+def wait_for_downloads() -> int:
+    """helper function to wait until all queued PDF downloads are finished
+       :return: number of failed downloads
+    """
+    with _DOWNLOAD_LOCK:
+        futures = dict(_DOWNLOAD_FUTURES)
+        _DOWNLOAD_FUTURES.clear()
+        _QUEUED_DOWNLOADS.clear()
 
+    failed_downloads = 0
+    for future in tqdm(as_completed(futures), total=len(futures), desc="Downloading PDFs"):
+        try:
+            future.result()
+        except Exception as error:
+            failed_downloads += 1
+            print(f"Could not download '{futures[future]}': {error}")
 
-def save_other_pdfs(url: str, name: str, paper_name: str) -> None:
-    """helper function to download the pdfs of a given link"""
-    name = name.replace(" ", "_").lower()
-    save_path = f"./{name}"
-    paper_name = paper_name.split("/")[-1] + ".pdf"
-    pdf_save_path = save_path + "/" + paper_name
+    return failed_downloads
 
 
-    if not os.path.isdir(save_path):
-        os.mkdir(save_path)
+def append_to_jsonl(output_file, data: dict) -> None:
+    """helper function to append the data of a single paper as a line to a JSONL file"""
+    output_file.write(orjson.dumps(data) + b"\n")
+    output_file.flush()
 
 
-def save_to_json(name: str, data: dict) -> None:
-    """helper function to dump the paper data for every author into a JSON"""
-    name = name.replace(" ", "_").lower()
-    output_file = open(name+".json", "w")
-    json.dump(data, output_file, indent=6)
-    output_file.close()
+def finalize_json(slug: str) -> None:
+    """helper function to convert the JSONL file of an author into a single JSON array"""
+    with open(slug+".jsonl", "rb") as input_file:
+        data = [orjson.loads(line) for line in input_file]
+    with open(slug+".json", "wb") as output_file:
+        output_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.remove(slug+".jsonl")
 
 
-def main(author: str, download_pdf: bool) -> None:
+def main(author: str, download_pdf: bool, collect_pdf_links: bool = False,
+         workers: int = MAX_WORKERS) -> None:
     """main function of the crawler"""
 
-    for person in tqdm(author, desc="Crawling authors"):
-        # obtain the complete list of publications for a given author
-        paper_list = get_list_of_papers(person)
-
-        if paper_list is not None:
-            # dictionary of all papers with their metadata
-            paper_info_list = list()
-            for paper in paper_list:
-                paper_info_list.append(get_paper_info(paper, download_pdf, person))
-                save_to_json(person, paper_info_list)
-        else:
-            print(f"No papers found for '{person}' ...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for person in tqdm(author, desc="Crawling authors"):
+            # obtain the complete list of publications for a given author
+            paper_list = get_list_of_papers(person)
+
+            if paper_list is not None:
+                # the file and directory names of the author are only derived once
+                slug = person.replace(" ", "_").lower()
+                save_dir = Path(f"./{slug}")
+                if download_pdf:
+                    save_dir.mkdir(exist_ok=True)
+
+                # fetch the papers concurrently, the main thread is the only writer
+                # and appends the papers to the authors JSONL file in publication order
+                futures = [executor.submit(get_paper_info, paper, download_pdf, save_dir,
+                                           collect_pdf_links)
+                           for paper in paper_list]
+                with open(slug+".jsonl", "wb") as output_file:
+                    for future in futures:
+                        paper_info = future.result()
+                        # records without an extractor (e.g. homepages) are skipped
+                        if paper_info is not None:
+                            append_to_jsonl(output_file, paper_info)
+                # write the final JSON exactly once after all papers are crawled
+                finalize_json(slug)
+            else:
+                print(f"No papers found for '{person}' ...")
+
+    if download_pdf:
+        failed_downloads = wait_for_downloads()
+        if failed_downloads > 0:
+            print(f"{failed_downloads} PDF downloads failed ...")
 
 
 if __name__ == "__main__":
@@ -281,6 +433,11 @@ if __name__ == "__main__":
                         type=str, nargs="+", required=True)
     parser.add_argument("--download_pdf", "-p", help="Download PDFs",
                         action="store_true", default=False)
+    parser.add_argument("--collect_pdf_links", "-l",
+                        help="Search the publisher sites for PDF links",
+                        action="store_true", default=False)
+    parser.add_argument("--workers", "-w", help="Number of papers to crawl concurrently",
+                        type=int, default=MAX_WORKERS)
     args = parser.parse_args()
 
     main(**vars(args))